@@ -0,0 +1,11 @@
+"""pytest 公共夹具"""
+
+import pytest
+
+from src.data.solar_terms import get_all_solar_terms_for_year
+
+
+@pytest.fixture(scope="module")
+def terms_2024():
+    """2024年全年节气，同一测试模块内只计算一次"""
+    return get_all_solar_terms_for_year(2024)
@@ -1,20 +1,23 @@
 """二十四节气数据"""
 
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List, Tuple, Optional
 
 # 二十四节气名称
-SOLAR_TERMS = [
+SOLAR_TERMS = (
     "小寒", "大寒", "立春", "雨水", "惊蛰", "春分",
     "清明", "谷雨", "立夏", "小满", "芒种", "夏至",
     "小暑", "大暑", "立秋", "处暑", "白露", "秋分",
     "寒露", "霜降", "立冬", "小雪", "大雪", "冬至"
-]
+)
 
 # 二十四节气精确数据 (1901-2050年)
 # 数据格式：每年24个节气，每个节气用一个字节表示日期
 # 参考lunar.py中的SOLAR_TERMS_DATA
-SOLAR_TERMS_DATA = (
+# 以 bytes 连续存储，下标和切片取出的仍是整数，比整数元组更紧凑
+SOLAR_TERMS_DATA = bytes((
     0x96, 0xB4, 0x96, 0xA6, 0x97, 0x97, 0x78, 0x79, 0x79, 0x69, 0x78, 0x77, #1901 
     0x96, 0xA4, 0x96, 0x96, 0x97, 0x87, 0x79, 0x79, 0x79, 0x69, 0x78, 0x78, #1902 
     0x96, 0xA5, 0x87, 0x96, 0x87, 0x87, 0x79, 0x69, 0x69, 0x69, 0x78, 0x78, #1903 
@@ -165,7 +168,7 @@ SOLAR_TERMS_DATA = (
     0x95, 0xB4, 0xA5, 0xB4, 0xA5, 0xA5, 0x97, 0x87, 0x87, 0x88, 0x86, 0x96, #2048 
     0xA4, 0xC3, 0xA5, 0xA5, 0xA5, 0xA6, 0x97, 0x87, 0x87, 0x78, 0x87, 0x86, #2049 
     0xA5, 0xC3, 0xA5, 0xB5, 0xA6, 0xA6, 0x87, 0x88, 0x78, 0x78, 0x87, 0x87  #2050
-)
+))
 
 # 节气对应的月份（大致）
 SOLAR_TERM_MONTHS = {
@@ -177,6 +180,26 @@ SOLAR_TERM_MONTHS = {
     "立冬": 11, "小雪": 11, "大雪": 12, "冬至": 12
 }
 
+# 节气名称到索引的映射
+_TERM_INDEX = {term: i for i, term in enumerate(SOLAR_TERMS)}
+
+# 节气对应的季节
+_TERM_SEASON = {}
+for _season, _terms in (
+    ("春", ("立春", "雨水", "惊蛰", "春分", "清明", "谷雨")),
+    ("夏", ("立夏", "小满", "芒种", "夏至", "小暑", "大暑")),
+    ("秋", ("立秋", "处暑", "白露", "秋分", "寒露", "霜降")),
+    ("冬", ("立冬", "小雪", "大雪", "冬至", "小寒", "大寒")),
+):
+    _TERM_SEASON.update(dict.fromkeys(_terms, _season))
+del _season, _terms
+
+# 每个月份包含的节气 (索引, 名称)，与年份无关
+_MONTH_TERMS = {
+    month: tuple((i, term) for i, term in enumerate(SOLAR_TERMS) if SOLAR_TERM_MONTHS[term] == month)
+    for month in range(1, 13)
+}
+
 def _decode_solar_term_data(year: int, term_index: int) -> int:
     """
     从SOLAR_TERMS_DATA中解码指定年份和节气的日期
@@ -221,24 +244,65 @@ def _decode_solar_term_data(year: int, term_index: int) -> int:
     return day
 
 
+@lru_cache(maxsize=256)
+def _terms_for_year(year: int) -> Tuple[Tuple[int, ...], Tuple[str, ...]]:
+    """
+    获取指定年份按时间排序的节气表
+    
+    Args:
+        year: 年份 (1901-2049)
+        
+    Returns:
+        (公历序数元组, 节气名称元组)，两者一一对应，用于二分查找
+    """
+    if year < 1901 or year > 2049:
+        return (), ()
+    
+    # 一次取出当年的12个字节整体解码，不再逐个节气调用 _decode_solar_term_data
+    # 每个字节对应一个月：高4位为上半月节气（15减该值），低4位为下半月节气（该值加15）
+    offset = (year - 1901) * 12
+    terms = []
+    for month, byte_data in enumerate(SOLAR_TERMS_DATA[offset:offset + 12], 1):
+        for term_index, term_day in (
+            (month * 2 - 2, 15 - ((byte_data >> 4) & 0x0F)),
+            (month * 2 - 1, 15 + (byte_data & 0x0F)),
+        ):
+            try:
+                terms.append((date(year, month, term_day).toordinal(), SOLAR_TERMS[term_index]))
+            except ValueError:
+                continue
+    
+    terms.sort()
+    return tuple(o for o, _ in terms), tuple(t for _, t in terms)
+
+
+@lru_cache(maxsize=256)
+def _term_by_month_day(year: int) -> Dict[Tuple[int, int], str]:
+    """
+    获取指定年份 (月, 日) 到节气名称的映射
+    
+    Args:
+        year: 年份 (1901-2049)
+        
+    Returns:
+        以 (月, 日) 为键的节气名称字典
+    """
+    ordinals, names = _terms_for_year(year)
+    result = {}
+    for ordinal, term in zip(ordinals, names):
+        term_date = date.fromordinal(ordinal)
+        result[(term_date.month, term_date.day)] = term
+    return result
+
+
 def get_solar_term_for_date(year: int, month: int, day: int) -> Optional[str]:
     """获取指定日期的节气"""
     # 检查年份范围
     if year < 1901 or year > 2049:
         return None
     
-    # 遍历所有节气，查找匹配的日期
-    for i, term in enumerate(SOLAR_TERMS):
-        try:
-            term_day = _decode_solar_term_data(year, i)
-            term_month = SOLAR_TERM_MONTHS[term]
-            
-            if month == term_month and day == term_day:
-                return term
-        except ValueError:
-            continue
-    
-    return None
+    # 节气日期都是合法日期，无效日期自然查不到
+    return _term_by_month_day(year).get((month, day))
 
 def get_solar_terms_for_month(year: int, month: int) -> List[Tuple[str, int]]:
     """获取指定月份的所有节气"""
@@ -247,70 +311,40 @@ def get_solar_terms_for_month(year: int, month: int) -> List[Tuple[str, int]]:
     
     terms = []
     
-    for i, term in enumerate(SOLAR_TERMS):
+    for i, term in _MONTH_TERMS.get(month, ()):
         try:
-            term_month = SOLAR_TERM_MONTHS[term]
-            if term_month == month:
-                term_day = _decode_solar_term_data(year, i)
-                terms.append((term, term_day))
+            term_day = _decode_solar_term_data(year, i)
+            terms.append((term, term_day))
         except ValueError:
             continue
     
-    return sorted(terms, key=lambda x: x[1])
+    # 上半月节气不晚于15日、下半月节气不早于15日，按索引解码即为时间顺序
+    return terms
 
 def get_next_solar_term(year: int, month: int, day: int) -> Optional[Tuple[str, datetime]]:
     """获取下一个节气"""
     if year < 1901 or year > 2049:
         return None
     
-    current_date = datetime(year, month, day)
+    target = date(year, month, day).toordinal()
     
-    # 查找当年剩余的节气
-    next_terms = []
-    
-    for i, term in enumerate(SOLAR_TERMS):
-        try:
-            term_month = SOLAR_TERM_MONTHS[term]
-            term_day = _decode_solar_term_data(year, i)
-            term_date = datetime(year, term_month, term_day)
-            
-            if term_date > current_date:
-                next_terms.append((term, term_date))
-        except ValueError:
-            continue
-    
-    if next_terms:
-        next_terms.sort(key=lambda x: x[1])
-        return next_terms[0]
+    # 在当年节气表中二分查找之后的第一个节气
+    ordinals, names = _terms_for_year(year)
+    idx = bisect_right(ordinals, target)
+    if idx < len(ordinals):
+        return names[idx], datetime.fromordinal(ordinals[idx])
     
     # 如果当年没有剩余节气，返回下一年的第一个节气
     if year + 1 <= 2049:
-        try:
-            next_year_term_day = _decode_solar_term_data(year + 1, 0)  # 小寒
-            next_year_first = datetime(year + 1, 1, next_year_term_day)
-            return ("小寒", next_year_first)
-        except ValueError:
-            return None
+        ordinals, names = _terms_for_year(year + 1)
+        if ordinals:
+            return names[0], datetime.fromordinal(ordinals[0])
     
     return None
 
 def get_season_by_solar_term(term: str) -> str:
     """根据节气获取季节"""
-    spring_terms = ["立春", "雨水", "惊蛰", "春分", "清明", "谷雨"]
-    summer_terms = ["立夏", "小满", "芒种", "夏至", "小暑", "大暑"]
-    autumn_terms = ["立秋", "处暑", "白露", "秋分", "寒露", "霜降"]
-    winter_terms = ["立冬", "小雪", "大雪", "冬至", "小寒", "大寒"]
-    
-    if term in spring_terms:
-        return "春"
-    elif term in summer_terms:
-        return "夏"
-    elif term in autumn_terms:
-        return "秋"
-    elif term in winter_terms:
-        return "冬"
-    else:
-        return "未知"
+    return _TERM_SEASON.get(term, "未知")
 
 
 def get_solar_term_date(year: int, term: str) -> Optional[datetime]:
@@ -327,11 +361,11 @@ def get_solar_term_date(year: int, term: str) -> Optional[datetime]:
     if year < 1901 or year > 2049:
         return None
     
-    if term not in SOLAR_TERMS:
+    term_index = _TERM_INDEX.get(term)
+    if term_index is None:
         return None
     
     try:
-        term_index = SOLAR_TERMS.index(term)
         term_day = _decode_solar_term_data(year, term_index)
         term_month = SOLAR_TERM_MONTHS[term]
         
@@ -353,16 +387,6 @@ def get_all_solar_terms_for_year(year: int) -> List[Tuple[str, datetime]]:
     if year < 1901 or year > 2049:
         return []
     
-    terms = []
-    
-    for i, term in enumerate(SOLAR_TERMS):
-        try:
-            term_day = _decode_solar_term_data(year, i)
-            term_month = SOLAR_TERM_MONTHS[term]
-            term_date = datetime(year, term_month, term_day)
-            terms.append((term, term_date))
-        except ValueError:
-            continue
-    
-    # 按日期排序
-    return sorted(terms, key=lambda x: x[1])
\ No newline at end of file
+    # 复用已缓存的当年节气表（已按时间排序），每次返回新列表，调用方可自由修改
+    ordinals, names = _terms_for_year(year)
+    return [(term, datetime.fromordinal(ordinal)) for ordinal, term in zip(ordinals, names)]
\ No newline at end of file
@@ -1,13 +1,23 @@
 import asyncio
+import bisect
+import json
+import time
 import httpx
+from collections import namedtuple
 from datetime import datetime, timedelta
 from typing import Dict, Any, Optional, List
 from fastmcp import FastMCP
 
+# orjson 为可选依赖，未安装时回退到标准库 json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # 导入工具函数
 try:
     from utils.logger import setup_logger
-    from utils.date_utils import get_weekday
+    from utils.date_utils import get_weekday, parse_date
     from tools.lunar import LunarTools
 except ImportError:
     import logging
@@ -19,6 +29,9 @@ except ImportError:
         weekdays = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
         return {'weekday_name_en': weekdays[date_obj.weekday()]}
     
+    def parse_date(date_str):
+        return datetime.strptime(date_str, "%Y-%m-%d")
+    
     # 如果导入失败，创建一个简化的LunarTools类
     class LunarTools:
         @staticmethod
@@ -37,6 +50,34 @@ except ImportError:
         def get_8zi(year, month, day, hour=12):
             return {"error": "农历转换模块未安装"}
 
+# 导入磁盘缓存
+try:
+    from utils.holiday_cache import load_holiday_data_with_age, save_holiday_data
+except ImportError:
+    def load_holiday_data_with_age(year):
+        return None
+    
+    def save_holiday_data(year, data):
+        return False
+
+# 导入节气模块
+try:
+    from .data.solar_terms import get_solar_terms_for_month, get_season_by_solar_term
+except ImportError:
+    try:
+        from data.solar_terms import get_solar_terms_for_month, get_season_by_solar_term
+    except ImportError:
+        get_solar_terms_for_month = get_season_by_solar_term = None
+
+# 导入八字计算模块
+try:
+    from .data.bazi_calculator import calculate_bazi
+except ImportError:
+    try:
+        from data.bazi_calculator import calculate_bazi
+    except ImportError:
+        calculate_bazi = None
+
 # 设置日志
 logger = setup_logger(__name__)
 
@@ -47,24 +88,122 @@ mcp = FastMCP("中国节假日MCP服务器")
 PRIMARY_DATA_SOURCE = "https://cdn.jsdelivr.net/gh/NateScarlet/holiday-cn@master/{year}.json"
 BACKUP_DATA_SOURCE = "https://raw.githubusercontent.com/NateScarlet/holiday-cn/master/{year}.json"
 
+# 星期名称 (0=星期一)
+_WEEKDAYS_EN = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+_WEEKDAYS_CN = ('星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日')
+
+# 标记次年数据尚未请求，与"已请求但无数据"的None区分
+_NOT_FETCHED = object()
+
+# 单个数据源的请求超时（秒），主备数据源并发请求，超时可以设置得较短
+SOURCE_TIMEOUT_SECONDS = 5.0
+
 # TTL 缓存配置 (7天)
 CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
 
+# HTTP/2 需要安装 h2，未安装时回退到 HTTP/1.1
+try:
+    import h2  # noqa: F401
+    _HTTP2_ENABLED = True
+except ImportError:
+    _HTTP2_ENABLED = False
+
+# 全局复用的 HTTP 客户端，保持与数据源的长连接，避免每次请求重新握手
+# 客户端与进程同生命周期：mcp.run() 返回时事件循环已关闭，无法再 aclose，连接随进程退出释放
+_http_client = httpx.AsyncClient(
+    http2=_HTTP2_ENABLED,
+    timeout=10.0,
+    limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+    headers={"accept-encoding": "gzip"},
+)
+
+
+def _json_dumps(obj: Any) -> str:
+    """序列化工具返回结果为紧凑 JSON，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _json_loads(content: bytes) -> Any:
+    """解析数据源返回的 JSON，优先使用 orjson"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+# 单个年份的节假日索引，按日期排序的并列数组，同一行号对应同一天
+HolidayIndex = namedtuple("HolidayIndex", [
+    "dates",          # 日期字符串
+    "names",          # 节日名称
+    "notes",          # 备注
+    "is_off",         # 是否休息
+    "weekdays_en",    # 英文星期名称
+    "by_date",        # 日期字符串 -> 行号，用于单日查询
+    "off_day_dates",  # 法定节假日日期（有序），用于二分查找
+    "off_day_rows",   # 与 off_day_dates 对应的行号
+    "work_day_rows",  # 调休工作日的行号（有序）
+])
+
 # 简单的内存缓存
 _holiday_cache: Dict[int, Dict[str, Any]] = {}
-_holiday_cache_ts: Dict[int, float] = {}  # 缓存时间戳
+_holiday_cache_expires: Dict[int, float] = {}  # 缓存过期时间 (time.monotonic)
 _refreshing_years: set = set()  # 正在刷新的年份
+_holiday_index: Dict[int, HolidayIndex] = {}  # 按年份预先构建的查询索引
+_year_holidays_json: Dict[int, str] = {}  # current_year_holidays 的序列化结果
+_year_work_days_json: Dict[int, str] = {}  # current_year_work_days 的序列化结果
+
+
+def _build_holiday_index(data: Dict[str, Any]) -> HolidayIndex:
+    """根据原始节假日数据构建查询索引"""
+    days = sorted(
+        (day for day in data.get('days', []) if day.get('date')),
+        key=lambda day: day['date']
+    )
+    dates = tuple(day['date'] for day in days)
+    names = tuple(day.get('name', '') for day in days)
+    # 保留数据源中的原始值：缺少 isOffDay 的条目既不算节假日，也不算调休工作日
+    is_off = tuple(day.get('isOffDay', False) for day in days)
+    off_day_rows = tuple(row for row, (name, off) in enumerate(zip(names, is_off)) if off and name)
+    work_day_rows = tuple(
+        row for row, day in enumerate(days)
+        if not day.get('isOffDay', True) and names[row]
+    )
+    return HolidayIndex(
+        dates=dates,
+        names=names,
+        notes=tuple(day.get('note', '') for day in days),
+        is_off=is_off,
+        weekdays_en=tuple(_WEEKDAYS_EN[datetime.fromisoformat(d).weekday()] for d in dates),
+        by_date={d: row for row, d in enumerate(dates)},
+        off_day_dates=tuple(dates[row] for row in off_day_rows),
+        off_day_rows=off_day_rows,
+        work_day_rows=work_day_rows,
+    )
+
+
+def _holiday_row(index: HolidayIndex, row: int) -> Dict[str, Any]:
+    """取出索引中某一行的节假日信息"""
+    return {"date": index.dates[row], "name": index.names[row], "note": index.notes[row]}
+
+
+def _store_holiday_data(year: int, data: Dict[str, Any], fetched_at: float):
+    """写入缓存并同步重建该年份的索引，同时使该年份的序列化结果失效"""
+    _holiday_index[year] = _build_holiday_index(data)
+    _year_holidays_json.pop(year, None)
+    _year_work_days_json.pop(year, None)
+    _holiday_cache[year] = data
+    _holiday_cache_expires[year] = fetched_at + CACHE_TTL_SECONDS
+
 
 async def fetch_holiday_data(year: int) -> Optional[Dict[str, Any]]:
     """获取指定年份的节假日数据，支持 TTL 缓存和后台刷新"""
-    import time
-    
-    current_time = time.time()
+    # 使用单调时钟判断过期，不受系统时间调整影响
+    current_time = time.monotonic()
     
     # 检查缓存是否存在且未过期
     if year in _holiday_cache:
-        cache_time = _holiday_cache_ts.get(year, 0)
-        if current_time - cache_time < CACHE_TTL_SECONDS:
+        if _holiday_cache_expires.get(year, 0) > current_time:
             # 缓存未过期，直接返回
             return _holiday_cache[year]
         else:
@@ -76,33 +215,69 @@ async def fetch_holiday_data(year: int) -> Optional[Dict[str, Any]]:
             # 返回过期的缓存数据（stale-while-revalidate）
             return _holiday_cache[year]
     
-    # 缓存不存在，同步获取数据
+    # 内存缓存不存在，先尝试磁盘缓存，再从网络获取
+    cached = load_holiday_data_with_age(year)
+    if cached is not None:
+        data, age = cached
+        # 按磁盘文件的写入时间起算内存缓存的过期时间，而不是重新计满7天
+        if data:
+            _store_holiday_data(year, data, current_time - age)
+        return data
+    
     data = await _fetch_holiday_data_sync(year)
     if data:
-        _holiday_cache[year] = data
-        _holiday_cache_ts[year] = current_time
+        _store_holiday_data(year, data, current_time)
     
     return data
 
 
+async def get_holiday_index(year: int) -> Optional[HolidayIndex]:
+    """获取指定年份的节假日索引，数据不可用时返回None"""
+    data = await fetch_holiday_data(year)
+    if not data:
+        return None
+    # 索引只由 _store_holiday_data 与缓存一同写入，缓存中有数据时索引必然存在
+    return _holiday_index[year]
+
+
+def _consume_task_exception(task: "asyncio.Task") -> None:
+    """取走已结束请求的异常，提前返回时未检查的失败请求不会触发 "Task exception was never retrieved" """
+    if not task.cancelled():
+        task.exception()
+
+
 async def _fetch_holiday_data_sync(year: int) -> Optional[Dict[str, Any]]:
-    """同步获取节假日数据的内部函数"""
+    """同步获取节假日数据的内部函数，同时请求主备数据源并采用最先成功的结果"""
     # 数据源列表
     urls = [
         PRIMARY_DATA_SOURCE.format(year=year),
         BACKUP_DATA_SOURCE.format(year=year)
     ]
     
-    async with httpx.AsyncClient() as client:
-        for url in urls:
-            try:
-                response = await client.get(url, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    return data
-            except Exception as e:
-                logger.warning(f"从{url}获取数据失败: {e}")
-                continue
+    tasks = {
+        asyncio.create_task(_http_client.get(url, timeout=SOURCE_TIMEOUT_SECONDS)): url
+        for url in urls
+    }
+    for task in tasks:
+        task.add_done_callback(_consume_task_exception)
+    pending = set(tasks)
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                url = tasks[task]
+                try:
+                    response = task.result()
+                    if response.status_code == 200:
+                        data = _json_loads(response.content)
+                        save_holiday_data(year, data)
+                        return data
+                except Exception as e:
+                    logger.warning(f"从{url}获取数据失败: {e}")
+    finally:
+        # 已拿到结果或函数退出时取消仍在进行的请求
+        for task in pending:
+            task.cancel()
     
     logger.error(f"无法获取{year}年节假日数据")
     return None
@@ -110,15 +285,12 @@ async def _fetch_holiday_data_sync(year: int) -> Optional[Dict[str, Any]]:
 
 async def _refresh_holiday_data(year: int):
     """后台刷新指定年份的节假日数据"""
-    import time
-    
     try:
         # 获取新数据
         new_data = await _fetch_holiday_data_sync(year)
         if new_data:
             # 更新缓存和时间戳
-            _holiday_cache[year] = new_data
-            _holiday_cache_ts[year] = time.time()
+            _store_holiday_data(year, new_data, time.monotonic())
             logger.info(f"后台刷新{year}年节假日数据成功")
         else:
             logger.warning(f"后台刷新{year}年节假日数据失败")
@@ -140,43 +312,34 @@ async def holiday_info(date: str = None) -> str:
         
         # 验证日期格式
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = parse_date(date)
         except ValueError:
             return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
+        # 统一为补零的 YYYY-MM-DD，与数据源中的日期字符串一致
+        date = date_obj.date().isoformat()
         
         # 获取星期几信息
-        try:
-            weekdays_en = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            weekday_index = date_obj.weekday()
-            weekday_name_en = weekdays_en[weekday_index]
-        except Exception as e:
-            weekday_name_en = ''
-            logger.warning(f"获取星期几信息失败: {e}")
+        weekday_name_en = _WEEKDAYS_EN[date_obj.weekday()]
         
-        year = int(date.split('-')[0])
-        holiday_data = await fetch_holiday_data(year)
+        year = date_obj.year
+        holiday_index = await get_holiday_index(year)
         
-        if not holiday_data:
+        if not holiday_index:
             return '{"error": "无法获取节假日数据"}'
         
         # 查找指定日期的信息
-        date_info = None
-        for day in holiday_data.get('days', []):
-            if day.get('date') == date:
-                date_info = day
-                break
-        
-        if date_info:
-            is_holiday = date_info.get('isOffDay', False)
-            holiday_name = date_info.get('name', '')
+        row = holiday_index.by_date.get(date)
+        
+        if row is not None:
+            is_holiday = holiday_index.is_off[row]
             
             result = {
                 "date": date,
-                "name": holiday_name,
+                "name": holiday_index.names[row],
                 "type": "holiday" if is_holiday else "work",
                 "is_holiday": is_holiday,
                 "is_work_day": not is_holiday,
-                "note": date_info.get('note', ''),
+                "note": holiday_index.notes[row],
                 "weekday_name_en": weekday_name_en
             }
         else:
@@ -192,8 +355,7 @@ async def holiday_info(date: str = None) -> str:
                 "weekday_name_en": weekday_name_en
             }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"查询节假日信息失败: {e}")
@@ -205,29 +367,23 @@ async def current_year_holidays() -> str:
     """
     try:
         current_year = datetime.now().year
-        holiday_data = await fetch_holiday_data(current_year)
+        holiday_index = await get_holiday_index(current_year)
         
-        if not holiday_data:
+        if not holiday_index:
             return '{"error": "无法获取节假日数据"}'
         
-        holidays = []
-        for day in holiday_data.get('days', []):
-            if day.get('isOffDay', False) and day.get('name'):
-                # 获取星期几信息
-                try:
-                    date_obj = datetime.strptime(day['date'], "%Y-%m-%d")
-                    weekdays_en = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                    weekday_index = date_obj.weekday()
-                    weekday_name_en = weekdays_en[weekday_index]
-                except Exception:
-                    weekday_name_en = ''
-                
-                holidays.append({
-                    "date": day['date'],
-                    "name": day['name'],
-                    "note": day.get('note', ''),
-                    "weekday_name_en": weekday_name_en
-                })
+        cached = _year_holidays_json.get(current_year)
+        if cached is not None:
+            return cached
+        
+        holidays = [
+            {"date": d, "name": n, "note": nt, "weekday_name_en": w}
+            for d, n, nt, w, off in zip(
+                holiday_index.dates, holiday_index.names, holiday_index.notes,
+                holiday_index.weekdays_en, holiday_index.is_off
+            )
+            if off and n
+        ]
         
         result = {
             "year": current_year,
@@ -235,8 +391,8 @@ async def current_year_holidays() -> str:
             "total_count": len(holidays)
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        text = _year_holidays_json[current_year] = _json_dumps(result)
+        return text
         
     except Exception as e:
         logger.error(f"获取当前年份节假日失败: {e}")
@@ -254,34 +410,38 @@ async def next_holiday(date: str = None) -> str:
         else:
             # 验证日期格式
             try:
-                today = datetime.strptime(date, "%Y-%m-%d").date()
+                today = parse_date(date).date()
             except ValueError:
                 return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
+        today_iso = today.isoformat()
         current_year = today.year
+        next_year = current_year + 1
         
-        # 先查找当前年份的节假日
-        holiday_data = await fetch_holiday_data(current_year)
+        # 先查找当前年份的节假日；当年数据尚未缓存时并发获取次年数据，避免两次串行的网络往返
+        next_year_index = _NOT_FETCHED
+        if current_year in _holiday_cache:
+            holiday_index = await get_holiday_index(current_year)
+        else:
+            holiday_index, next_year_index = await asyncio.gather(
+                get_holiday_index(current_year),
+                get_holiday_index(next_year)
+            )
         
         next_holiday_info = None
         
-        # 查找当前年份的下一个节假日
-        if holiday_data:
-            for day in holiday_data.get('days', []):
-                if day.get('isOffDay', False) and day.get('name'):
-                    holiday_date = datetime.strptime(day['date'], "%Y-%m-%d").date()
-                    if holiday_date > today:
-                        next_holiday_info = day
-                        break
+        # 查找当前年份的下一个节假日（ISO日期字符串按字典序即按时间排序）
+        if holiday_index:
+            idx = bisect.bisect_right(holiday_index.off_day_dates, today_iso)
+            if idx < len(holiday_index.off_day_rows):
+                next_holiday_info = _holiday_row(holiday_index, holiday_index.off_day_rows[idx])
         
         # 如果当前年份没有找到，查找下一年的第一个节假日；若数据库未更新则兜底为次年元旦
         if not next_holiday_info:
-            next_year = current_year + 1
-            next_year_data = await fetch_holiday_data(next_year)
-            if next_year_data:
-                for day in next_year_data.get('days', []):
-                    if day.get('isOffDay', False) and day.get('name'):
-                        next_holiday_info = day
-                        break
+            # 次年数据已在并发请求中获取过（即使结果为None）则不再重复请求
+            if next_year_index is _NOT_FETCHED:
+                next_year_index = await get_holiday_index(next_year)
+            if next_year_index and next_year_index.off_day_rows:
+                next_holiday_info = _holiday_row(next_year_index, next_year_index.off_day_rows[0])
         
         # 数据库未更新，则使用次年元旦作为兜底
         if not next_holiday_info:
@@ -293,16 +453,11 @@ async def next_holiday(date: str = None) -> str:
                 }
         
         # 计算距离天数
-        holiday_date = datetime.strptime(next_holiday_info['date'], "%Y-%m-%d").date()
+        holiday_date = datetime.fromisoformat(next_holiday_info['date']).date()
         days_until = (holiday_date - today).days
         
         # 获取星期几信息
-        try:
-            weekdays_en = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-            weekday_index = holiday_date.weekday()
-            weekday_name_en = weekdays_en[weekday_index]
-        except Exception:
-            weekday_name_en = ''
+        weekday_name_en = _WEEKDAYS_EN[holiday_date.weekday()]
         
         result = {
             "date": next_holiday_info['date'],
@@ -312,8 +467,7 @@ async def next_holiday(date: str = None) -> str:
             "weekday_name_en": weekday_name_en
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"获取下一个节假日失败: {e}")
@@ -325,29 +479,25 @@ async def current_year_work_days() -> str:
     """
     try:
         current_year = datetime.now().year
-        holiday_data = await fetch_holiday_data(current_year)
+        holiday_index = await get_holiday_index(current_year)
         
-        if not holiday_data:
+        if not holiday_index:
             return '{"error": "无法获取节假日数据"}'
         
-        work_days = []
-        for day in holiday_data.get('days', []):
-            if not day.get('isOffDay', True) and day.get('name'):  # 调休工作日
-                # 获取星期几信息
-                try:
-                    date_obj = datetime.strptime(day['date'], "%Y-%m-%d")
-                    weekdays_en = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-                    weekday_index = date_obj.weekday()
-                    weekday_name_en = weekdays_en[weekday_index]
-                except Exception:
-                    weekday_name_en = ''
-                
-                work_days.append({
-                    "date": day['date'],
-                    "name": day['name'] + "-需要上班",
-                    "note": day.get('note', ''),
-                    "weekday_name_en": weekday_name_en
-                })
+        cached = _year_work_days_json.get(current_year)
+        if cached is not None:
+            return cached
+        
+        # 调休工作日
+        work_days = [
+            {
+                "date": holiday_index.dates[row],
+                "name": holiday_index.names[row] + "-需要上班",
+                "note": holiday_index.notes[row],
+                "weekday_name_en": holiday_index.weekdays_en[row]
+            }
+            for row in holiday_index.work_day_rows
+        ]
         
         result = {
             "year": current_year,
@@ -355,8 +505,8 @@ async def current_year_work_days() -> str:
             "total_count": len(work_days)
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        text = _year_work_days_json[current_year] = _json_dumps(result)
+        return text
         
     except Exception as e:
         logger.error(f"获取当前年份调休工作日失败: {e}")
@@ -558,7 +708,7 @@ async def gregorian_to_lunar(date: str) -> str:
     try:
         # 验证日期格式
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = parse_date(date)
         except ValueError:
             return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
         
@@ -583,8 +733,7 @@ async def gregorian_to_lunar(date: str) -> str:
             "zodiac": zodiac
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"公历转农历失败: {e}")
@@ -599,7 +748,7 @@ async def lunar_to_gregorian(date: str, is_leap: bool = False) -> str:
     try:
         # 验证日期格式
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = parse_date(date)
         except ValueError:
             return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
         
@@ -619,8 +768,7 @@ async def lunar_to_gregorian(date: str, is_leap: bool = False) -> str:
             "gregorian_date": f"{greg_year:04d}-{greg_month:02d}-{greg_day:02d}"
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"农历转公历失败: {e}")
@@ -634,15 +782,14 @@ async def get_lunar_string(date: str) -> str:
     try:
         # 验证日期格式
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = parse_date(date)
         except ValueError:
             return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
         
         year, month, day = date_obj.year, date_obj.month, date_obj.day
         result = LunarTools.get_lunar_string(year, month, day)
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"获取农历信息失败: {e}")
@@ -656,20 +803,14 @@ async def get_24_lunar_feast(date: str) -> str:
     try:
         # 验证日期格式
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = parse_date(date)
         except ValueError:
             return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
         
         year, month = date_obj.year, date_obj.month
         
-        # 导入节气模块
-        try:
-            from .data.solar_terms import get_solar_terms_for_month, get_season_by_solar_term
-        except ImportError:
-            try:
-                from data.solar_terms import get_solar_terms_for_month, get_season_by_solar_term
-            except ImportError:
-                return '{"error": "节气模块未找到"}'
+        if get_solar_terms_for_month is None:
+            return '{"error": "节气模块未找到"}'
         
         # 获取该月份的所有节气
         month_terms = get_solar_terms_for_month(year, month)
@@ -699,8 +840,7 @@ async def get_24_lunar_feast(date: str) -> str:
             "solar_terms": solar_terms_list
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"获取节气信息失败: {e}")
@@ -716,7 +856,7 @@ async def get_8zi(date: str, hour: int = 12, minute: int = 0) -> str:
     try:
         # 验证日期格式
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = parse_date(date)
         except ValueError:
             return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
         
@@ -728,14 +868,8 @@ async def get_8zi(date: str, hour: int = 12, minute: int = 0) -> str:
         
         year, month, day = date_obj.year, date_obj.month, date_obj.day
         
-        # 导入八字计算模块
-        try:
-            from .data.bazi_calculator import calculate_bazi
-        except ImportError:
-            try:
-                from data.bazi_calculator import calculate_bazi
-            except ImportError:
-                return '{"error": "八字计算模块未找到"}'
+        if calculate_bazi is None:
+            return '{"error": "八字计算模块未找到"}'
         
         # 使用八字计算模块
         bazi_result = calculate_bazi(year, month, day, hour)
@@ -745,8 +879,7 @@ async def get_8zi(date: str, hour: int = 12, minute: int = 0) -> str:
             "eight_characters": bazi_result["eight_characters"]
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"计算八字失败: {e}")
@@ -760,25 +893,21 @@ async def get_weekday(date: str) -> str:
     try:
         # 验证日期格式
         try:
-            date_obj = datetime.strptime(date, "%Y-%m-%d")
+            date_obj = parse_date(date)
         except ValueError:
             return '{"error": "日期格式错误，请使用YYYY-MM-DD格式"}'
         
-        weekdays_cn = ['星期一', '星期二', '星期三', '星期四', '星期五', '星期六', '星期日']
-        weekdays_en = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
         weekday_index = date_obj.weekday()
         
         result = {
             "date": date,
             "weekday_index": weekday_index + 1,  # 1-7，周一为1
-            "weekday_name_cn": weekdays_cn[weekday_index],
-            "weekday_name_en": weekdays_en[weekday_index],
+            "weekday_name_cn": _WEEKDAYS_CN[weekday_index],
+            "weekday_name_en": _WEEKDAYS_EN[weekday_index],
             "is_weekend": weekday_index >= 5
         }
         
-        import json
-        return json.dumps(result, ensure_ascii=False, indent=2)
+        return _json_dumps(result)
         
     except Exception as e:
         logger.error(f"获取星期几失败: {e}")
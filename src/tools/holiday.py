@@ -1,8 +1,9 @@
 """节假日查询工具模块"""
 
+import bisect
 import json
 import httpx
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 from typing import Dict, Any, Optional, List
 from mcp.types import Tool, TextContent
 try:
@@ -59,10 +60,36 @@ except ImportError:
     class ValidationError(Exception):
         pass
 
+try:
+    from ..utils.holiday_cache import load_holiday_data, save_holiday_data
+except ImportError:
+    def load_holiday_data(year):
+        return None
+    
+    def save_holiday_data(year, data):
+        return False
+
+try:
+    from ..utils.date_utils import parse_date
+except ImportError:
+    def parse_date(date_str):
+        return datetime.strptime(date_str, "%Y-%m-%d")
+
 # 数据源配置
 PRIMARY_DATA_SOURCE = "https://cdn.jsdelivr.net/gh/NateScarlet/holiday-cn@master/{year}.json"
 BACKUP_DATA_SOURCE = "https://raw.githubusercontent.com/NateScarlet/holiday-cn/master/{year}.json"
 
+# 进程内共享的 HTTP 客户端，复用与数据源的连接，连接失败时自动重试
+# 客户端与进程同生命周期，不单独关闭，连接随进程退出释放
+_http_client = httpx.AsyncClient(
+    transport=httpx.AsyncHTTPTransport(
+        retries=2,
+        limits=httpx.Limits(max_connections=20, max_keepalive_connections=4),
+    ),
+    timeout=10,
+    headers={"User-Agent": "china-festival-mcp"},
+)
+
 
 class HolidayTools:
     """节假日查询工具类"""
@@ -113,8 +140,10 @@ class HolidayTools:
     @staticmethod
     async def fetch_holiday_data(year: int) -> Optional[Dict[str, Any]]:
         """获取指定年份的节假日数据"""
-        # 简单的内存缓存
-        cache_key = f"holiday_data_{year}"
+        # 优先读取磁盘缓存
+        data = load_holiday_data(year)
+        if data is not None:
+            return data
         
         # 数据源列表
         urls = [
@@ -122,16 +151,16 @@ class HolidayTools:
             BACKUP_DATA_SOURCE.format(year=year)
         ]
         
-        async with httpx.AsyncClient() as client:
-            for url in urls:
-                try:
-                    response = await client.get(url, timeout=10)
-                    if response.status_code == 200:
-                        data = response.json()
-                        return data
-                except Exception as e:
-                    print(f"从{url}获取数据失败: {e}")
-                    continue
+        for url in urls:
+            try:
+                response = await _http_client.get(url)
+                if response.status_code == 200:
+                    data = response.json()
+                    save_holiday_data(year, data)
+                    return data
+            except Exception as e:
+                print(f"从{url}获取数据失败: {e}")
+                continue
         
         print(f"无法获取{year}年节假日数据")
         return None
@@ -144,11 +173,12 @@ class HolidayTools:
             if not date_str:
                 date_str = datetime.now().strftime("%Y-%m-%d")
             
-            # 验证日期格式
+            # 验证日期格式，非标准写法（如 2024-1-1）回退到 strptime 并统一补零
             try:
-                date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+                date_obj = parse_date(date_str)
             except ValueError:
                 return {"error": "日期格式错误，请使用YYYY-MM-DD格式"}
+            date_str = date_obj.date().isoformat()
             
             # 获取星期几信息
             try:
@@ -233,8 +263,10 @@ class HolidayTools:
     async def get_next_holiday() -> Dict[str, Any]:
         """获取下一个节假日"""
         try:
-            current_date = datetime.now().strftime("%Y-%m-%d")
-            current_year = datetime.now().year
+            # 只取一次当前日期，避免跨零点时前后不一致
+            today = date.today()
+            current_date = today.isoformat()
+            current_year = today.year
             
             # 获取当前年份和下一年的节假日数据
             holiday_data = await HolidayTools.fetch_holiday_data(current_year)
@@ -254,19 +286,22 @@ class HolidayTools:
                     if day.get('isOffDay', False):  # 只获取节假日
                         all_holidays.append(day)
             
-            # 找到下一个节假日
+            # 找到下一个节假日：数据源不保证顺序，先按日期排序（跳过缺少日期的条目），
+            # ISO日期字符串按字典序即按时间排序，可直接二分查找
+            all_holidays = sorted(
+                (holiday for holiday in all_holidays if holiday.get('date')),
+                key=lambda holiday: holiday['date']
+            )
             next_holiday = None
-            for holiday in all_holidays:
-                holiday_date = holiday.get('date')
-                if holiday_date > current_date:
-                    next_holiday = holiday
-                    break
+            holiday_dates = [holiday['date'] for holiday in all_holidays]
+            idx = bisect.bisect_right(holiday_dates, current_date)
+            if idx < len(all_holidays):
+                next_holiday = all_holidays[idx]
             
             if next_holiday:
                 # 计算距离天数
-                holiday_date = datetime.strptime(next_holiday['date'], '%Y-%m-%d')
-                current_date_obj = datetime.strptime(current_date, '%Y-%m-%d')
-                days_until = (holiday_date - current_date_obj).days
+                holiday_date = date.fromisoformat(next_holiday['date'])
+                days_until = (holiday_date - today).days
                 
                 # 获取星期几信息
                 try:
@@ -324,14 +359,9 @@ class HolidayTools:
     async def handle_tool_call(name: str, arguments: Dict[str, Any]) -> List[TextContent]:
         """处理工具调用"""
         try:
-            if name == "holiday_info":
-                result = await HolidayTools.get_holiday_info(arguments.get("date"))
-            elif name == "current_year_holidays":
-                result = await HolidayTools.get_current_year_holidays()
-            elif name == "next_holiday":
-                result = await HolidayTools.get_next_holiday()
-            elif name == "current_year_work_days":
-                result = await HolidayTools.get_current_year_work_days()
+            handler = _TOOL_HANDLERS.get(name)
+            if handler is not None:
+                result = await handler(arguments)
             else:
                 result = {"error": f"未知的工具: {name}"}
             
@@ -339,4 +369,13 @@ class HolidayTools:
         except Exception as e:
             print(f"处理工具调用失败: {e}")
             error_result = {"error": f"工具调用失败: {str(e)}"}
-            return [TextContent(type="text", text=json.dumps(error_result, ensure_ascii=False, indent=2))]
\ No newline at end of file
+            return [TextContent(type="text", text=json.dumps(error_result, ensure_ascii=False, indent=2))]
+
+
+# 工具名称 -> 处理函数，导入时构建一次，分发时只需一次字典查找
+_TOOL_HANDLERS = {
+    "holiday_info": lambda arguments: HolidayTools.get_holiday_info(arguments.get("date")),
+    "current_year_holidays": lambda arguments: HolidayTools.get_current_year_holidays(),
+    "next_holiday": lambda arguments: HolidayTools.get_next_holiday(),
+    "current_year_work_days": lambda arguments: HolidayTools.get_current_year_work_days(),
+}
@@ -540,8 +540,6 @@ class LunarTools:
     def get_24_lunar_feast(year: int, month: int) -> Dict[str, Any]:
         """获取二十四节气信息"""
         try:
-            from datetime import datetime
-            
             # 获取该月份的所有节气
             month_terms = get_solar_terms_for_month(year, month)
             
@@ -4,7 +4,7 @@ from typing import Any, Sequence
 from mcp.types import Tool, TextContent
 import json
 
-from ..utils.date_utils import get_weekday
+from ..utils.date_utils import get_weekday, is_iso_date_format
 from ..utils.logger import setup_logger
 from ..utils.error_handler import handle_errors
 
@@ -59,8 +59,7 @@ class WeekdayTools:
             raise ValueError("缺少必需参数: date")
         
         # 严格验证日期格式
-        import re
-        if not re.match(r'^\d{4}-\d{2}-\d{2}$', date_str):
+        if not is_iso_date_format(date_str):
             raise ValueError("日期格式错误，请使用YYYY-MM-DD格式，如：2024-01-01")
         
         # 解析日期字符串
@@ -82,7 +81,7 @@ class WeekdayTools:
         # 计算星期几
         result = get_weekday(year, month, day)
         
-        logger.info(f"函数 get_weekday 调用成功, 参数: {{'args': ('{date_str}',), 'kwargs': {{}}}}")
+        logger.info("函数 get_weekday 调用成功, 参数: {'args': ('%s',), 'kwargs': {}}", date_str)
         
         return [TextContent(
             type="text",
@@ -1,7 +1,7 @@
 """工具模块"""
 
-from .cache import CacheManager
+from .holiday_cache import load_holiday_data, save_holiday_data
 from .logger import setup_logger
 from .date_utils import format_date, validate_date
 
-__all__ = ["CacheManager", "setup_logger", "format_date", "validate_date"]
\ No newline at end of file
+__all__ = ["load_holiday_data", "save_holiday_data", "setup_logger", "format_date", "validate_date"]
\ No newline at end of file
@@ -1,9 +1,32 @@
 """日期处理工具模块"""
 
 import re
+from calendar import isleap
 from datetime import datetime
 from typing import Optional, Tuple
 
+# YYYY-MM-DD 日期格式，只接受 ASCII 数字，需配合 fullmatch 使用以拒绝结尾换行符
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})')
+
+# 平年各月天数
+_DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+
+def _split_date(date_str: str) -> Optional[Tuple[int, int, int]]:
+    """按 YYYY-MM-DD 拆分日期并检查取值范围，无效时返回None"""
+    if not date_str:
+        return None
+    match = _DATE_RE.fullmatch(date_str)
+    if not match:
+        return None
+    year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+    if year < 1 or not 1 <= month <= 12:
+        return None
+    max_day = 29 if month == 2 and isleap(year) else _DAYS_IN_MONTH[month - 1]
+    if not 1 <= day <= max_day:
+        return None
+    return year, month, day
+
 
 def validate_date(date_str: str) -> bool:
     """验证日期格式是否正确
@@ -14,19 +37,39 @@ def validate_date(date_str: str) -> bool:
     Returns:
         是否为有效日期格式
     """
-    if not date_str:
-        return False
-    
-    # 检查格式
-    pattern = r'^\d{4}-\d{2}-\d{2}$'
-    if not re.match(pattern, date_str):
-        return False
-    
-    try:
-        datetime.strptime(date_str, '%Y-%m-%d')
-        return True
-    except ValueError:
-        return False
+    return _split_date(date_str) is not None
+
+
+def is_iso_date_format(date_str: str) -> bool:
+    """检查是否为补零的 YYYY-MM-DD 写法（只看格式，不检查取值范围）
+
+    Args:
+        date_str: 日期字符串
+
+    Returns:
+        是否符合 YYYY-MM-DD 格式
+    """
+    return bool(date_str) and _DATE_RE.fullmatch(date_str) is not None
+
+
+def parse_date(date_str: str) -> datetime:
+    """解析 YYYY-MM-DD 日期字符串
+
+    标准写法直接用 fromisoformat 解析；其余输入（如未补零的 2024-1-1）
+    回退到 strptime('%Y-%m-%d')，接受范围与 strptime 一致。
+
+    Args:
+        date_str: 日期字符串 YYYY-MM-DD
+
+    Returns:
+        对应的 datetime 对象
+
+    Raises:
+        ValueError: 日期格式错误
+    """
+    if _DATE_RE.fullmatch(date_str):
+        return datetime.fromisoformat(date_str)
+    return datetime.strptime(date_str, '%Y-%m-%d')
 
 
 def format_date(date_input: str) -> str:
@@ -83,11 +126,11 @@ def parse_date_components(date_str: str) -> Tuple[int, int, int]:
     Raises:
         ValueError: 日期格式错误
     """
-    if not validate_date(date_str):
+    components = _split_date(date_str)
+    if components is None:
         raise ValueError(f"无效的日期格式: {date_str}")
     
-    date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-    return date_obj.year, date_obj.month, date_obj.day
+    return components
 
 
 def get_year_from_date(date_str: str) -> int:
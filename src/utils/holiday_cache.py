@@ -0,0 +1,91 @@
+"""节假日数据磁盘缓存模块"""
+
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+# 缓存目录
+CACHE_DIR = Path.home() / ".cache" / "china-festival-mcp"
+
+# 磁盘缓存有效期 (24小时)
+DISK_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+
+def get_cache_path(year: int) -> Path:
+    """获取指定年份的缓存文件路径
+
+    Args:
+        year: 年份
+
+    Returns:
+        缓存文件路径
+    """
+    return CACHE_DIR / f"{year}.json"
+
+
+def load_holiday_data_with_age(year: int, ttl: float = DISK_CACHE_TTL_SECONDS) -> Optional[Tuple[Dict[str, Any], float]]:
+    """从磁盘读取节假日数据及其已缓存时长
+
+    以文件修改时间判断是否过期，无需在文件内保存过期时间。
+
+    Args:
+        year: 年份
+        ttl: 有效期（秒）
+
+    Returns:
+        (节假日数据, 距写入的秒数)，缓存不存在、已过期或损坏时返回None
+    """
+    path = get_cache_path(year)
+    try:
+        age = max(0.0, time.time() - os.path.getmtime(path))
+        if age >= ttl:
+            return None
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f), age
+    except (OSError, ValueError):
+        return None
+
+
+def load_holiday_data(year: int, ttl: float = DISK_CACHE_TTL_SECONDS) -> Optional[Dict[str, Any]]:
+    """从磁盘读取节假日数据
+
+    Args:
+        year: 年份
+        ttl: 有效期（秒）
+
+    Returns:
+        未过期的节假日数据，缓存不存在、已过期或损坏时返回None
+    """
+    cached = load_holiday_data_with_age(year, ttl)
+    return None if cached is None else cached[0]
+
+
+def save_holiday_data(year: int, data: Dict[str, Any]) -> bool:
+    """将节假日数据写入磁盘
+
+    先写入同目录下的临时文件再通过 os.replace 原子替换，
+    避免并发读取到写了一半的文件。
+
+    Args:
+        year: 年份
+        data: 节假日数据
+
+    Returns:
+        是否写入成功
+    """
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, prefix=f".{year}.", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, ensure_ascii=False)
+            os.replace(tmp_path, get_cache_path(year))
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return True
+    except (OSError, TypeError, ValueError):
+        return False
@@ -6,9 +6,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
-# 创建日志目录
+# 日志目录，在创建文件处理器时按需创建
 LOG_DIR = Path(__file__).parent.parent.parent / "logs"
-LOG_DIR.mkdir(exist_ok=True)
 
 def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     """设置日志记录器
@@ -44,6 +43,7 @@ def setup_logger(name: str, level: str = "INFO") -> logging.Logger:
     
     # 创建文件处理器（如果可能）
     try:
+        LOG_DIR.mkdir(exist_ok=True)
         log_file = LOG_DIR / f"{name}_{datetime.now().strftime('%Y%m%d')}.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(logging.DEBUG)
@@ -66,20 +66,21 @@ def log_function_call(func_name: str, args: dict, result: any = None, error: Exc
     logger = get_logger()
     
     if error:
-        logger.error(f"函数 {func_name} 调用失败: {error}, 参数: {args}")
+        logger.error("函数 %s 调用失败: %s, 参数: %s", func_name, error, args)
     else:
-        logger.info(f"函数 {func_name} 调用成功, 参数: {args}")
-        if result is not None:
-            logger.debug(f"函数 {func_name} 返回结果类型: {type(result).__name__}")
+        # 成功路径使用惰性格式化，日志级别关闭时不拼接字符串
+        logger.info("函数 %s 调用成功, 参数: %s", func_name, args)
+        if result is not None and logger.isEnabledFor(logging.DEBUG):
+            logger.debug("函数 %s 返回结果类型: %s", func_name, type(result).__name__)
 
 def log_api_request(endpoint: str, params: dict, response_time: float = None, error: Exception = None):
     """记录API请求日志"""
     logger = get_logger()
     
     if error:
-        logger.error(f"API请求失败 {endpoint}: {error}, 参数: {params}")
+        logger.error("API请求失败 %s: %s, 参数: %s", endpoint, error, params)
     else:
-        logger.info(f"API请求成功 {endpoint}, 参数: {params}, 响应时间: {response_time:.2f}s")
+        logger.info("API请求成功 %s, 参数: %s, 响应时间: %.2fs", endpoint, params, response_time)
 
 # 初始化默认日志记录器
 default_logger = setup_logger("china_festival_mcp")
\ No newline at end of file
@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试日期校验功能
+"""
+
+from datetime import datetime
+
+import pytest
+
+from src.utils.date_utils import validate_date, parse_date_components, parse_date
+
+def test_validate_date_accepts_valid_dates():
+    """测试合法日期"""
+    for date_str in ["2024-01-01", "2024-02-29", "2023-12-31", "0001-01-01", "9999-12-31"]:
+        assert validate_date(date_str), date_str
+
+    assert parse_date_components("2024-02-29") == (2024, 2, 29)
+
+def test_validate_date_rejects_malformed_input():
+    """测试格式错误或不存在的日期"""
+    malformed = [
+        "",
+        "2024-01-01\n",      # 结尾换行符
+        "٢٠٢٤-٠١-٠١",        # 阿拉伯-印度数字
+        "２０２４-０１-０１",  # 全角数字
+        " 2024-01-01",
+        "2024-1-1",
+        "2024/01/01",
+        "0000-01-01",
+        "2023-02-29",
+        "2024-04-31",
+        "2024-13-01",
+        "2024-00-10",
+        "2024-01-00",
+    ]
+
+    for date_str in malformed:
+        assert not validate_date(date_str), repr(date_str)
+        with pytest.raises(ValueError):
+            parse_date_components(date_str)
+
+def test_parse_date_keeps_strptime_rules():
+    """测试日期参数解析，未补零写法仍按 strptime 接受"""
+    assert parse_date("2024-02-29") == datetime(2024, 2, 29)
+    assert parse_date("2024-1-1") == datetime(2024, 1, 1)
+
+    for date_str in ["2024-01-01\n", "2023-02-29", "2024/01/01", ""]:
+        with pytest.raises(ValueError):
+            parse_date(date_str)
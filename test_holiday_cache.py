@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+测试节假日磁盘缓存
+"""
+
+import os
+import time
+
+import pytest
+
+from src.utils import holiday_cache
+from src.utils.holiday_cache import (
+    get_cache_path,
+    load_holiday_data,
+    load_holiday_data_with_age,
+    save_holiday_data,
+    DISK_CACHE_TTL_SECONDS,
+)
+
+SAMPLE_DATA = {
+    "year": 2024,
+    "days": [{"name": "元旦", "date": "2024-01-01", "isOffDay": True}],
+}
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    """把缓存目录指向临时目录"""
+    directory = tmp_path / "cache"
+    monkeypatch.setattr(holiday_cache, "CACHE_DIR", directory)
+    return directory
+
+def _set_age(path, seconds):
+    """把文件修改时间调到若干秒之前"""
+    mtime = time.time() - seconds
+    os.utime(path, (mtime, mtime))
+
+def test_save_and_load_roundtrip(cache_dir):
+    """测试写入后可以读回，且不残留临时文件"""
+    assert load_holiday_data(2024) is None
+
+    assert save_holiday_data(2024, SAMPLE_DATA)
+    assert get_cache_path(2024) == cache_dir / "2024.json"
+    assert load_holiday_data(2024) == SAMPLE_DATA
+    assert [p.name for p in cache_dir.iterdir()] == ["2024.json"]
+
+def test_save_replaces_existing_file(cache_dir):
+    """测试覆盖写入已有缓存"""
+    save_holiday_data(2024, {"year": 2024, "days": []})
+    save_holiday_data(2024, SAMPLE_DATA)
+
+    assert load_holiday_data(2024) == SAMPLE_DATA
+    assert [p.name for p in cache_dir.iterdir()] == ["2024.json"]
+
+def test_expired_by_mtime():
+    """测试以文件修改时间判断过期"""
+    save_holiday_data(2024, SAMPLE_DATA)
+    path = get_cache_path(2024)
+
+    _set_age(path, DISK_CACHE_TTL_SECONDS - 60)
+    assert load_holiday_data(2024) == SAMPLE_DATA
+
+    _set_age(path, DISK_CACHE_TTL_SECONDS + 60)
+    assert load_holiday_data(2024) is None
+    assert load_holiday_data(2024, ttl=2 * DISK_CACHE_TTL_SECONDS) == SAMPLE_DATA
+
+def test_load_with_age_reports_file_age():
+    """测试返回距写入的时长"""
+    save_holiday_data(2024, SAMPLE_DATA)
+    _set_age(get_cache_path(2024), 3600)
+
+    data, age = load_holiday_data_with_age(2024)
+    assert data == SAMPLE_DATA
+    assert 3590 <= age <= 3610
+
+def test_corrupt_file_returns_none(cache_dir):
+    """测试损坏的缓存文件按未命中处理"""
+    cache_dir.mkdir(parents=True)
+    get_cache_path(2024).write_text('{"year": 2024, "days": [', encoding="utf-8")
+
+    assert load_holiday_data(2024) is None
+    assert load_holiday_data_with_age(2024) is None
+
+def test_save_failure_returns_false(tmp_path, monkeypatch):
+    """测试缓存目录不可用时写入失败但不抛异常"""
+    blocker = tmp_path / "not_a_dir"
+    blocker.write_text("", encoding="utf-8")
+    monkeypatch.setattr(holiday_cache, "CACHE_DIR", blocker / "cache")
+
+    assert save_holiday_data(2024, SAMPLE_DATA) is False
+    assert load_holiday_data(2024) is None